@@ -20,6 +20,7 @@ from datetime import datetime
 import imp
 import json
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, Union, Optional
 from unittest.mock import Mock, patch, MagicMock
 
@@ -33,7 +34,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.mysql import dialect
 
-from tests.integration_tests.test_app import app, login
+from tests.integration_tests.test_app import app, login, STABLE_TEST_USERNAMES
 from superset.sql_parse import CtasMethod
 from superset import db, security_manager
 from superset.connectors.sqla.models import BaseDatasource, SqlaTable
@@ -49,6 +50,16 @@ FAKE_DB_NAME = "fake_db_100"
 test_client = app.test_client()
 
 
+@lru_cache(maxsize=1)
+def cached_example_default_schema() -> Optional[str]:
+    """
+    The default schema of the examples database cannot change within a test
+    run, but resolving it builds an engine and an inspector every call; cache
+    the first answer.
+    """
+    return get_example_default_schema()
+
+
 def get_resp(
     client: Any,
     url: str,
@@ -96,6 +107,12 @@ def post_assert_metric(
 
 
 class SupersetTestCase(TestCase):
+    # ids of the users seeded once per session by ``load_test_users_run``;
+    # memoizing them lets ``get_user`` resolve through the session identity
+    # map instead of issuing a SELECT on every call
+    _stable_usernames = STABLE_TEST_USERNAMES
+    _user_id_cache: dict[str, int] = {}
+
     default_schema_backend_map = {
         "sqlite": "main",
         "mysql": "superset",
@@ -159,13 +176,36 @@ class SupersetTestCase(TestCase):
 
     @staticmethod
     def get_user(username: str) -> ab_models.User:
+        cached_id = SupersetTestCase._user_id_cache.get(username)
+        if cached_id is not None:
+            return db.session.query(security_manager.user_model).get(cached_id)
         user = (
             db.session.query(security_manager.user_model)
             .filter_by(username=username)
             .one_or_none()
         )
+        if user is not None and username in SupersetTestCase._stable_usernames:
+            SupersetTestCase._user_id_cache[username] = user.id
         return user
 
+    @staticmethod
+    def get_user_id(username: str) -> Optional[int]:
+        """
+        Resolve a username to its id without hydrating the full ``User``
+        object (and its role/permission collections)
+        """
+        cached_id = SupersetTestCase._user_id_cache.get(username)
+        if cached_id is not None:
+            return cached_id
+        user_id = (
+            db.session.query(security_manager.user_model.id)
+            .filter_by(username=username)
+            .scalar()
+        )
+        if user_id is not None and username in SupersetTestCase._stable_usernames:
+            SupersetTestCase._user_id_cache[username] = user_id
+        return user_id
+
     @staticmethod
     def get_role(name: str) -> Optional[ab_models.User]:
         user = (
@@ -211,7 +251,7 @@ class SupersetTestCase(TestCase):
     def get_table(
         name: str, database_id: Optional[int] = None, schema: Optional[str] = None
     ) -> SqlaTable:
-        schema = schema or get_example_default_schema()
+        schema = schema or cached_example_default_schema()
 
         return (
             db.session.query(SqlaTable)
@@ -224,6 +264,27 @@ class SupersetTestCase(TestCase):
             .one()
         )
 
+    @staticmethod
+    def get_table_id(
+        name: str, database_id: Optional[int] = None, schema: Optional[str] = None
+    ) -> int:
+        """
+        Resolve a table name to its id without hydrating the full
+        ``SqlaTable`` object
+        """
+        schema = schema or cached_example_default_schema()
+
+        return (
+            db.session.query(SqlaTable.id)
+            .filter_by(
+                database_id=database_id
+                or SupersetTestCase.get_database_by_name("examples").id,
+                schema=schema,
+                table_name=name,
+            )
+            .scalar()
+        )
+
     @staticmethod
     def get_database_by_id(db_id: int) -> Database:
         return db.session.query(Database).filter_by(id=db_id).one()
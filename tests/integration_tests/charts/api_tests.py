@@ -18,14 +18,14 @@
 import json
 from io import BytesIO
 from unittest import mock
-from zipfile import is_zipfile, ZipFile
+from zipfile import ZIP_STORED, ZipFile
 
 import prison
 import pytest
 import yaml
 from flask_babel import lazy_gettext as _
-from parameterized import parameterized
-from sqlalchemy import and_
+from sqlalchemy import and_, event
+from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import func
 
 from superset.commands.chart.data.get_data_command import ChartDataCommand
@@ -34,16 +34,18 @@ from superset.connectors.sqla.models import SqlaTable
 from superset.extensions import cache_manager, db, security_manager
 from superset.models.core import Database, FavStar, FavStarClassName
 from superset.models.dashboard import Dashboard
-from superset.models.slice import Slice
+from superset.models.slice import Slice, slice_user
 from superset.reports.models import ReportSchedule, ReportScheduleType
-from superset.utils.core import get_example_default_schema
 from superset.utils.database import get_example_database
 from superset.viz import viz_types
 from tests.integration_tests.base_api_tests import ApiOwnersTestCaseMixin
-from tests.integration_tests.base_tests import SupersetTestCase
+from tests.integration_tests.base_tests import (
+    cached_example_default_schema,
+    SupersetTestCase,
+)
 from tests.integration_tests.conftest import with_feature_flags
 from tests.integration_tests.fixtures.birth_names_dashboard import (
-    load_birth_names_dashboard_with_slices,
+    load_birth_names_dashboard_with_slices_class_scope,
     load_birth_names_data,
 )
 from tests.integration_tests.fixtures.energy_dashboard import (
@@ -62,7 +64,7 @@ from tests.integration_tests.fixtures.unicode_dashboard import (
     load_unicode_data,
 )
 from tests.integration_tests.fixtures.world_bank_dashboard import (
-    load_world_bank_dashboard_with_slices,
+    load_world_bank_dashboard_with_slices_class_scope,
     load_world_bank_data,
 )
 from tests.integration_tests.insert_chart_mixin import InsertChartMixin
@@ -73,135 +75,432 @@ CHART_DATA_URI = "api/v1/chart/data"
 CHARTS_FIXTURE_COUNT = 10
 
 
+def _build_chart_import_bytes() -> bytes:
+    # the bundle contents are module constants, so serialize them once at
+    # import time; the payloads are tiny, so skip compression as well
+    buf = BytesIO()
+    with ZipFile(buf, "w", compression=ZIP_STORED) as bundle:
+        bundle.writestr(
+            "chart_export/metadata.yaml", yaml.safe_dump(chart_metadata_config)
+        )
+        bundle.writestr(
+            "chart_export/databases/imported_database.yaml",
+            yaml.safe_dump(database_config),
+        )
+        bundle.writestr(
+            "chart_export/datasets/imported_dataset.yaml",
+            yaml.safe_dump(dataset_config),
+        )
+        bundle.writestr(
+            "chart_export/charts/imported_chart.yaml", yaml.safe_dump(chart_config)
+        )
+    return buf.getvalue()
+
+
+CHART_IMPORT_BYTES = _build_chart_import_bytes()
+
+
+def _build_invalid_chart_import_bytes() -> bytes:
+    # same bundle but with a dataset metadata file, so the import fails
+    buf = BytesIO()
+    with ZipFile(buf, "w", compression=ZIP_STORED) as bundle:
+        bundle.writestr(
+            "chart_export/metadata.yaml", yaml.safe_dump(dataset_metadata_config)
+        )
+        bundle.writestr(
+            "chart_export/databases/imported_database.yaml",
+            yaml.safe_dump(database_config),
+        )
+        bundle.writestr(
+            "chart_export/datasets/imported_dataset.yaml",
+            yaml.safe_dump(dataset_config),
+        )
+        bundle.writestr(
+            "chart_export/charts/imported_chart.yaml", yaml.safe_dump(chart_config)
+        )
+    return buf.getvalue()
+
+
+INVALID_CHART_IMPORT_BYTES = _build_invalid_chart_import_bytes()
+
+CHART_IMPORT_BOUNDARY = "chartImportBoundary"
+CHART_IMPORT_CONTENT_TYPE = f"multipart/form-data; boundary={CHART_IMPORT_BOUNDARY}"
+
+
+def _build_import_form_body(zip_bytes: bytes, **fields: str) -> bytes:
+    """
+    Frame the multipart body once at import time instead of letting the test
+    client re-encode the zip payload on every POST.
+    """
+    delimiter = f"--{CHART_IMPORT_BOUNDARY}\r\n".encode()
+    parts = [
+        delimiter
+        + b'Content-Disposition: form-data; name="formData"; '
+        + b'filename="chart_export.zip"\r\n'
+        + b"Content-Type: application/zip\r\n\r\n"
+        + zip_bytes
+        + b"\r\n"
+    ]
+    for name, value in fields.items():
+        parts.append(
+            delimiter + f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n".encode()
+        )
+    parts.append(f"--{CHART_IMPORT_BOUNDARY}--\r\n".encode())
+    return b"".join(parts)
+
+
+CHART_IMPORT_BODY = _build_import_form_body(CHART_IMPORT_BYTES)
+CHART_IMPORT_OVERWRITE_BODY = _build_import_form_body(
+    CHART_IMPORT_BYTES, overwrite="true"
+)
+INVALID_CHART_IMPORT_BODY = _build_import_form_body(INVALID_CHART_IMPORT_BYTES)
+
+
+def _import_error_response(extra: dict) -> dict:
+    return {
+        "errors": [
+            {
+                "message": "Error importing chart",
+                "error_type": "GENERIC_COMMAND_ERROR",
+                "level": "warning",
+                "extra": {
+                    **extra,
+                    "issue_codes": [
+                        {
+                            "code": 1010,
+                            "message": (
+                                "Issue 1010 - Superset encountered an "
+                                "error while running a command."
+                            ),
+                        }
+                    ],
+                },
+            }
+        ]
+    }
+
+
+# expected error payloads built once at import instead of per test
+CHART_IMPORT_EXISTS_RESPONSE = _import_error_response(
+    {
+        "charts/imported_chart.yaml": (
+            "Chart already exists and `overwrite=true` was not passed"
+        ),
+    }
+)
+CHART_IMPORT_INVALID_RESPONSE = _import_error_response(
+    {"metadata.yaml": {"type": ["Must be equal to Slice."]}}
+)
+
+# static query strings used by several tests; encode them once
+INFO_PERMISSIONS_QUERY = prison.dumps({"keys": ["permissions"]})
+CHART_ALL_TEXT_ZY_QUERY = prison.dumps(
+    {
+        "filters": [{"col": "slice_name", "opr": "chart_all_text", "value": "zy_"}],
+        "order_column": "slice_name",
+        "order_direction": "asc",
+        "keys": ["none"],
+        "columns": ["slice_name", "description", "viz_type"],
+    }
+)
+CHART_HAS_CREATED_BY_QUERY = prison.dumps(
+    {
+        "filters": [
+            {"col": "created_by", "opr": "chart_has_created_by", "value": True}
+        ],
+        "keys": ["none"],
+        "columns": ["slice_name"],
+        # the tests only assert the count; hydrate as little as possible
+        "page_size": 1,
+    }
+)
+CHART_HAS_NO_CREATED_BY_QUERY = prison.dumps(
+    {
+        "filters": [
+            {"col": "created_by", "opr": "chart_has_created_by", "value": False}
+        ],
+        "keys": ["none"],
+        "columns": ["slice_name"],
+        # the tests only assert the count; hydrate as little as possible
+        "page_size": 1,
+    }
+)
+CHART_OWNED_CREATED_FAVORED_BY_ME_QUERY = prison.dumps(
+    {
+        "filters": [
+            {"col": "id", "opr": "chart_owned_created_favored_by_me", "value": True}
+        ],
+        "order_column": "slice_name",
+        "order_direction": "asc",
+        "page": 0,
+        "page_size": 25,
+    }
+)
+CHART_ALL_TEXT_ENERGY_QUERY = prison.dumps(
+    {
+        "filters": [{"col": "slice_name", "opr": "chart_all_text", "value": "energy"}],
+        "keys": ["none"],
+        "columns": ["slice_name", "description", "table.table_name"],
+    }
+)
+
+
+def _json(rv):
+    # decode through get_json() so the response iterator is consumed directly
+    # instead of concatenating it into one bytes object first
+    return rv.get_json()
+
+
+def _slices_by_name(slice_names):
+    # fetch all the slices a test needs in one IN(...) query instead of one
+    # SELECT per name
+    return {
+        slc.slice_name: slc
+        for slc in db.session.query(Slice).filter(Slice.slice_name.in_(slice_names))
+    }
+
+
+def _owner_ids(chart_id):
+    # read the association table directly instead of lazy-loading full User
+    # objects through Slice.owners
+    return {
+        user_id
+        for (user_id,) in db.session.query(slice_user.c.user_id).filter(
+            slice_user.c.slice_id == chart_id
+        )
+    }
+
+
+def _bulk_delete_charts(chart_ids):
+    # one DELETE per table instead of per-row ORM deletes with cascade checks
+    db.session.execute(slice_user.delete().where(slice_user.c.slice_id.in_(chart_ids)))
+    db.session.query(Slice).filter(Slice.id.in_(chart_ids)).delete(
+        synchronize_session=False
+    )
+    db.session.commit()
+
+
+@pytest.fixture(autouse=True, scope="module")
+def chart_api_app_context():
+    """
+    Keep one app context open for the whole module so fixtures don't pay
+    the enter/exit cost (and session teardown) on every invocation.
+    """
+    with app.app_context():
+        yield
+
+
 class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
     resource_name = "chart"
 
+    _shared_client = None
+
+    def _pre_setup(self):
+        # build one test client per class instead of per test: these API
+        # tests don't use flask-testing's template tracking or request
+        # context, they only need a clean session cookie between tests
+        self.app = self.create_app()
+        cls = type(self)
+        if cls._shared_client is None:
+            cls._shared_client = self.app.test_client()
+        self.client = cls._shared_client
+        self.client.delete_cookie("session")
+
+    def _post_teardown(self):
+        pass
+
     @pytest.fixture(autouse=True)
     def clear_data_cache(self):
         with app.app_context():
             cache_manager.data_cache.clear()
             yield
 
-    @pytest.fixture()
+    @pytest.fixture(autouse=True)
+    def rollback_transaction(self):
+        """
+        Run every test inside a nested transaction (SAVEPOINT) that is rolled
+        back on teardown.
+
+        The schema and sample users are created once per test session, so
+        tests only need isolation from each other's writes. Joining
+        ``db.session`` to an external transaction and rolling it back after
+        the test replaces the explicit ``db.session.delete(...)``/``commit()``
+        cleanup previously hand-written in every test and fixture, and is a
+        single round-trip regardless of how many rows a test touched.
+
+        The scoped session itself is kept in place (Flask-AppBuilder holds a
+        reference to it); only its factory is re-bound to the external
+        connection for the duration of the test.
+        """
+        with app.app_context():
+            connection = db.engine.connect()
+            sqlite = db.engine.url.get_backend_name() == "sqlite"
+            if sqlite:
+                # pysqlite implicitly ends the open transaction before
+                # SAVEPOINT statements; take over transaction control from the
+                # driver on this connection only, per the SQLAlchemy pysqlite
+                # documentation
+                connection.connection.dbapi_connection.isolation_level = None
+            transaction = connection.begin()
+            if sqlite:
+                connection.exec_driver_sql("BEGIN")
+            session_factory = db.session.session_factory
+            db.session.remove()
+            # an empty ``binds`` map is needed as well: Flask-SQLAlchemy
+            # populates it with a table -> engine map that would take
+            # precedence over the session-level bind
+            session_factory.configure(bind=connection, binds={})
+            nested = connection.begin_nested()
+
+            @event.listens_for(session_factory, "after_transaction_end")
+            def restart_savepoint(session, trans):
+                # the code under test commits (or rolls back) the SAVEPOINT;
+                # re-open one so the outer transaction is never committed
+                nonlocal nested
+                if not nested.is_active:
+                    nested = connection.begin_nested()
+
+            yield
+
+            event.remove(session_factory, "after_transaction_end", restart_savepoint)
+            db.session.remove()
+            session_factory.configure(bind=None, binds=db.get_binds(app))
+            transaction.rollback()
+            if sqlite:
+                connection.connection.dbapi_connection.isolation_level = ""
+            connection.close()
+
+    @pytest.fixture(scope="class")
     def create_charts(self):
-        with self.create_app().app_context():
-            charts = []
-            admin = self.get_user("admin")
-            for cx in range(CHARTS_FIXTURE_COUNT - 1):
-                charts.append(self.insert_chart(f"name{cx}", [admin.id], 1))
-            fav_charts = []
-            for cx in range(round(CHARTS_FIXTURE_COUNT / 2)):
-                fav_star = FavStar(
-                    user_id=admin.id, class_name="slice", obj_id=charts[cx].id
-                )
-                db.session.add(fav_star)
-                db.session.commit()
-                fav_charts.append(fav_star)
-            yield charts
-
-            # rollback changes
-            for chart in charts:
-                db.session.delete(chart)
-            for fav_chart in fav_charts:
-                db.session.delete(fav_chart)
-            db.session.commit()
+        # class-scoped: the charts are inserted once, outside the per-test
+        # SAVEPOINT, and shared by every test in the class; per-test mutations
+        # are still rolled back by ``rollback_transaction``
+        admin_id = self.get_user_id("admin")
+        charts = self._bulk_insert_charts(
+            [f"name{cx}" for cx in range(CHARTS_FIXTURE_COUNT - 1)], [admin_id], 1
+        )
+        db.session.bulk_insert_mappings(
+            FavStar,
+            [
+                {
+                    "user_id": admin_id,
+                    "class_name": "slice",
+                    "obj_id": charts[cx].id,
+                }
+                for cx in range(round(CHARTS_FIXTURE_COUNT / 2))
+            ],
+        )
+        db.session.commit()
+        chart_ids = [chart.id for chart in charts]
+        # expose the ids on the class so unittest-style tests (which cannot
+        # take fixture parameters) don't have to re-query by slice_name
+        type(self).chart_ids_by_name = {chart.slice_name: chart.id for chart in charts}
 
-    @pytest.fixture()
+        yield charts
+
+        del type(self).chart_ids_by_name
+        db.session.query(FavStar).filter(FavStar.obj_id.in_(chart_ids)).delete(
+            synchronize_session=False
+        )
+        _bulk_delete_charts(chart_ids)
+
+    @pytest.fixture(scope="class")
     def create_charts_created_by_gamma(self):
-        with self.create_app().app_context():
-            charts = []
-            user = self.get_user("gamma")
-            for cx in range(CHARTS_FIXTURE_COUNT - 1):
-                charts.append(self.insert_chart(f"gamma{cx}", [user.id], 1))
-            yield charts
-            # rollback changes
-            for chart in charts:
-                db.session.delete(chart)
-            db.session.commit()
+        charts = self._bulk_insert_charts(
+            [f"gamma{cx}" for cx in range(CHARTS_FIXTURE_COUNT - 1)],
+            [self.get_user_id("gamma")],
+            1,
+        )
+        chart_ids = [chart.id for chart in charts]
 
-    @pytest.fixture()
+        yield charts
+
+        _bulk_delete_charts(chart_ids)
+
+    @pytest.fixture(scope="class")
     def create_certified_charts(self):
-        with self.create_app().app_context():
-            certified_charts = []
-            admin = self.get_user("admin")
-            for cx in range(CHARTS_FIXTURE_COUNT):
-                certified_charts.append(
-                    self.insert_chart(
-                        f"certified{cx}",
-                        [admin.id],
-                        1,
-                        certified_by="John Doe",
-                        certification_details="Sample certification",
-                    )
-                )
+        certified_charts = self._bulk_insert_charts(
+            [f"certified{cx}" for cx in range(CHARTS_FIXTURE_COUNT)],
+            [self.get_user_id("admin")],
+            1,
+            certified_by="John Doe",
+            certification_details="Sample certification",
+        )
+        chart_ids = [chart.id for chart in certified_charts]
 
-            yield certified_charts
+        yield certified_charts
 
-            # rollback changes
-            for chart in certified_charts:
-                db.session.delete(chart)
-            db.session.commit()
+        _bulk_delete_charts(chart_ids)
 
     @pytest.fixture()
     def create_chart_with_report(self):
-        with self.create_app().app_context():
-            admin = self.get_user("admin")
-            chart = self.insert_chart(f"chart_report", [admin.id], 1)
-            report_schedule = ReportSchedule(
-                type=ReportScheduleType.REPORT,
-                name="report_with_chart",
-                crontab="* * * * *",
-                chart=chart,
-            )
-            db.session.commit()
-
-            yield chart
+        chart = self.insert_chart(f"chart_report", [self.get_user_id("admin")], 1)
+        report_schedule = ReportSchedule(
+            type=ReportScheduleType.REPORT,
+            name="report_with_chart",
+            crontab="* * * * *",
+            chart=chart,
+        )
+        db.session.add(report_schedule)
+        db.session.commit()
+        self.chart_with_report = chart
 
-            # rollback changes
-            db.session.delete(report_schedule)
-            db.session.delete(chart)
-            db.session.commit()
+        yield chart
 
     @pytest.fixture()
     def add_dashboard_to_chart(self):
-        with self.create_app().app_context():
-            admin = self.get_user("admin")
+        admin = self.get_user("admin")
 
-            self.chart = self.insert_chart("My chart", [admin.id], 1)
+        self.chart = self.insert_chart("My chart", [admin.id], 1)
 
-            self.original_dashboard = Dashboard()
-            self.original_dashboard.dashboard_title = "Original Dashboard"
-            self.original_dashboard.slug = "slug"
-            self.original_dashboard.owners = [admin]
-            self.original_dashboard.slices = [self.chart]
-            self.original_dashboard.published = False
-            db.session.add(self.original_dashboard)
+        self.original_dashboard = Dashboard()
+        self.original_dashboard.dashboard_title = "Original Dashboard"
+        self.original_dashboard.slug = "slug"
+        self.original_dashboard.owners = [admin]
+        self.original_dashboard.slices = [self.chart]
+        self.original_dashboard.published = False
+        db.session.add(self.original_dashboard)
 
-            self.new_dashboard = Dashboard()
-            self.new_dashboard.dashboard_title = "New Dashboard"
-            self.new_dashboard.slug = "new_slug"
-            self.new_dashboard.owners = [admin]
-            self.new_dashboard.published = False
-            db.session.add(self.new_dashboard)
+        self.new_dashboard = Dashboard()
+        self.new_dashboard.dashboard_title = "New Dashboard"
+        self.new_dashboard.slug = "new_slug"
+        self.new_dashboard.owners = [admin]
+        self.new_dashboard.published = False
+        db.session.add(self.new_dashboard)
 
-            db.session.commit()
+        db.session.commit()
 
-            yield self.chart
+        yield self.chart
 
-            db.session.delete(self.original_dashboard)
-            db.session.delete(self.new_dashboard)
-            db.session.delete(self.chart)
-            db.session.commit()
+    @pytest.fixture(scope="class")
+    def tmp_perm_chart(self):
+        chart = Slice(
+            id=100,
+            datasource_id=1,
+            datasource_type="table",
+            datasource_name="tmp_perm_table",
+            slice_name="slice_name",
+        )
+        db.session.add(chart)
+        db.session.commit()
+        # unittest-style tests cannot take fixture parameters; expose the id
+        # on the class instead
+        type(self).tmp_perm_chart_id = chart.id
+
+        yield chart
+
+        del type(self).tmp_perm_chart_id
+        _bulk_delete_charts([chart.id])
 
     def test_info_security_chart(self):
         """
         Chart API: Test info security
         """
         self.login(username="admin")
-        params = {"keys": ["permissions"]}
-        uri = f"api/v1/chart/_info?q={prison.dumps(params)}"
+        uri = f"api/v1/chart/_info?q={INFO_PERMISSIONS_QUERY}"
         rv = self.get_assert_metric(uri, "info")
-        data = json.loads(rv.data.decode("utf-8"))
+        data = _json(rv)
         assert rv.status_code == 200
         assert set(data["permissions"]) == {
             "can_read",
@@ -210,34 +509,17 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
             "can_warm_up_cache",
         }
 
-    def create_chart_import(self):
-        buf = BytesIO()
-        with ZipFile(buf, "w") as bundle:
-            with bundle.open("chart_export/metadata.yaml", "w") as fp:
-                fp.write(yaml.safe_dump(chart_metadata_config).encode())
-            with bundle.open(
-                "chart_export/databases/imported_database.yaml", "w"
-            ) as fp:
-                fp.write(yaml.safe_dump(database_config).encode())
-            with bundle.open("chart_export/datasets/imported_dataset.yaml", "w") as fp:
-                fp.write(yaml.safe_dump(dataset_config).encode())
-            with bundle.open("chart_export/charts/imported_chart.yaml", "w") as fp:
-                fp.write(yaml.safe_dump(chart_config).encode())
-        buf.seek(0)
-        return buf
-
     def test_delete_chart(self):
         """
         Chart API: Test delete
         """
-        admin_id = self.get_user("admin").id
+        admin_id = self.get_user_id("admin")
         chart_id = self.insert_chart("name", [admin_id], 1).id
         self.login(username="admin")
         uri = f"api/v1/chart/{chart_id}"
         rv = self.delete_assert_metric(uri, "delete")
-        self.assertEqual(rv.status_code, 200)
-        model = db.session.query(Slice).get(chart_id)
-        self.assertEqual(model, None)
+        assert rv.status_code == 200
+        assert not db.session.query(Slice.id).filter_by(id=chart_id).scalar()
 
     def test_delete_bulk_charts(self):
         """
@@ -245,22 +527,25 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         """
         admin = self.get_user("admin")
         chart_count = 4
-        chart_ids = list()
-        for chart_name_index in range(chart_count):
-            chart_ids.append(
-                self.insert_chart(f"title{chart_name_index}", [admin.id], 1, admin).id
+        chart_ids = [
+            chart.id
+            for chart in self._bulk_insert_charts(
+                [f"title{cx}" for cx in range(chart_count)],
+                [admin.id],
+                1,
+                created_by=admin,
             )
+        ]
         self.login(username="admin")
         argument = chart_ids
         uri = f"api/v1/chart/?q={prison.dumps(argument)}"
         rv = self.delete_assert_metric(uri, "bulk_delete")
-        self.assertEqual(rv.status_code, 200)
-        response = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 200
+        response = _json(rv)
         expected_response = {"message": f"Deleted {chart_count} charts"}
-        self.assertEqual(response, expected_response)
-        for chart_id in chart_ids:
-            model = db.session.query(Slice).get(chart_id)
-            self.assertEqual(model, None)
+        assert response == expected_response
+        remaining = db.session.query(Slice.id).filter(Slice.id.in_(chart_ids)).count()
+        assert remaining == 0
 
     def test_delete_bulk_chart_bad_request(self):
         """
@@ -271,7 +556,7 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         argument = chart_ids
         uri = f"api/v1/chart/?q={prison.dumps(argument)}"
         rv = self.delete_assert_metric(uri, "bulk_delete")
-        self.assertEqual(rv.status_code, 400)
+        assert rv.status_code == 400
 
     def test_delete_not_found_chart(self):
         """
@@ -281,7 +566,7 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         chart_id = 1000
         uri = f"api/v1/chart/{chart_id}"
         rv = self.delete_assert_metric(uri, "delete")
-        self.assertEqual(rv.status_code, 404)
+        assert rv.status_code == 404
 
     @pytest.mark.usefixtures("create_chart_with_report")
     def test_delete_chart_with_report(self):
@@ -289,30 +574,25 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         Chart API: Test delete with associated report
         """
         self.login(username="admin")
-        chart = (
-            db.session.query(Slice)
-            .filter(Slice.slice_name == "chart_report")
-            .one_or_none()
-        )
-        uri = f"api/v1/chart/{chart.id}"
+        uri = f"api/v1/chart/{self.chart_with_report.id}"
         rv = self.client.delete(uri)
-        response = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(rv.status_code, 422)
+        response = _json(rv)
+        assert rv.status_code == 422
         expected_response = {
             "message": "There are associated alerts or reports: report_with_chart"
         }
-        self.assertEqual(response, expected_response)
+        assert response == expected_response
 
     def test_delete_bulk_charts_not_found(self):
         """
         Chart API: Test delete bulk not found
         """
-        max_id = db.session.query(func.max(Slice.id)).scalar()
+        max_id = db.session.query(func.max(Slice.id)).scalar() or 0
         chart_ids = [max_id + 1, max_id + 2]
         self.login(username="admin")
         uri = f"api/v1/chart/?q={prison.dumps(chart_ids)}"
         rv = self.delete_assert_metric(uri, "bulk_delete")
-        self.assertEqual(rv.status_code, 404)
+        assert rv.status_code == 404
 
     @pytest.mark.usefixtures("create_chart_with_report", "create_charts")
     def test_bulk_delete_chart_with_report(self):
@@ -320,103 +600,80 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         Chart API: Test bulk delete with associated report
         """
         self.login(username="admin")
-        chart_with_report = (
-            db.session.query(Slice.id)
-            .filter(Slice.slice_name == "chart_report")
-            .one_or_none()
-        )
-
-        charts = db.session.query(Slice.id).filter(Slice.slice_name.like("name%")).all()
-        chart_ids = [chart.id for chart in charts]
-        chart_ids.append(chart_with_report.id)
+        chart_ids = list(self.chart_ids_by_name.values())
+        chart_ids.append(self.chart_with_report.id)
 
         uri = f"api/v1/chart/?q={prison.dumps(chart_ids)}"
         rv = self.client.delete(uri)
-        response = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(rv.status_code, 422)
+        response = _json(rv)
+        assert rv.status_code == 422
         expected_response = {
             "message": "There are associated alerts or reports: report_with_chart"
         }
-        self.assertEqual(response, expected_response)
+        assert response == expected_response
 
     def test_delete_chart_admin_not_owned(self):
         """
         Chart API: Test admin delete not owned
         """
-        gamma_id = self.get_user("gamma").id
+        gamma_id = self.get_user_id("gamma")
         chart_id = self.insert_chart("title", [gamma_id], 1).id
 
         self.login(username="admin")
         uri = f"api/v1/chart/{chart_id}"
         rv = self.delete_assert_metric(uri, "delete")
-        self.assertEqual(rv.status_code, 200)
-        model = db.session.query(Slice).get(chart_id)
-        self.assertEqual(model, None)
+        assert rv.status_code == 200
+        assert not db.session.query(Slice.id).filter_by(id=chart_id).scalar()
 
     def test_delete_bulk_chart_admin_not_owned(self):
         """
         Chart API: Test admin delete bulk not owned
         """
-        gamma_id = self.get_user("gamma").id
+        gamma_id = self.get_user_id("gamma")
         chart_count = 4
-        chart_ids = list()
-        for chart_name_index in range(chart_count):
-            chart_ids.append(
-                self.insert_chart(f"title{chart_name_index}", [gamma_id], 1).id
+        chart_ids = [
+            chart.id
+            for chart in self._bulk_insert_charts(
+                [f"title{cx}" for cx in range(chart_count)], [gamma_id], 1
             )
+        ]
 
         self.login(username="admin")
         argument = chart_ids
         uri = f"api/v1/chart/?q={prison.dumps(argument)}"
         rv = self.delete_assert_metric(uri, "bulk_delete")
-        response = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(rv.status_code, 200)
+        response = _json(rv)
+        assert rv.status_code == 200
         expected_response = {"message": f"Deleted {chart_count} charts"}
-        self.assertEqual(response, expected_response)
+        assert response == expected_response
 
-        for chart_id in chart_ids:
-            model = db.session.query(Slice).get(chart_id)
-            self.assertEqual(model, None)
+        remaining = db.session.query(Slice.id).filter(Slice.id.in_(chart_ids)).count()
+        assert remaining == 0
 
+    @pytest.mark.usefixtures("alpha_users")
     def test_delete_chart_not_owned(self):
         """
         Chart API: Test delete try not owned
         """
-        user_alpha1 = self.create_user(
-            "alpha1", "password", "Alpha", email="alpha1@superset.org"
-        )
-        user_alpha2 = self.create_user(
-            "alpha2", "password", "Alpha", email="alpha2@superset.org"
-        )
-        chart = self.insert_chart("title", [user_alpha1.id], 1)
+        chart = self.insert_chart("title", [self.get_user_id("alpha1")], 1)
         self.login(username="alpha2", password="password")
         uri = f"api/v1/chart/{chart.id}"
         rv = self.delete_assert_metric(uri, "delete")
-        self.assertEqual(rv.status_code, 403)
-        db.session.delete(chart)
-        db.session.delete(user_alpha1)
-        db.session.delete(user_alpha2)
-        db.session.commit()
+        assert rv.status_code == 403
 
+    @pytest.mark.usefixtures("alpha_users")
     def test_delete_bulk_chart_not_owned(self):
         """
         Chart API: Test delete bulk try not owned
         """
-        user_alpha1 = self.create_user(
-            "alpha1", "password", "Alpha", email="alpha1@superset.org"
-        )
-        user_alpha2 = self.create_user(
-            "alpha2", "password", "Alpha", email="alpha2@superset.org"
-        )
-
         chart_count = 4
-        charts = list()
-        for chart_name_index in range(chart_count):
-            charts.append(
-                self.insert_chart(f"title{chart_name_index}", [user_alpha1.id], 1)
-            )
+        charts = self._bulk_insert_charts(
+            [f"title{cx}" for cx in range(chart_count)],
+            [self.get_user_id("alpha1")],
+            1,
+        )
 
-        owned_chart = self.insert_chart("title_owned", [user_alpha2.id], 1)
+        owned_chart = self.insert_chart("title_owned", [self.get_user_id("alpha2")], 1)
 
         self.login(username="alpha2", password="password")
 
@@ -424,37 +681,30 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         arguments = [chart.id for chart in charts]
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.delete_assert_metric(uri, "bulk_delete")
-        self.assertEqual(rv.status_code, 403)
-        response = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 403
+        response = _json(rv)
         expected_response = {"message": "Forbidden"}
-        self.assertEqual(response, expected_response)
+        assert response == expected_response
 
         # # nothing is deleted in bulk with a list of owned and not owned charts
         arguments = [chart.id for chart in charts] + [owned_chart.id]
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.delete_assert_metric(uri, "bulk_delete")
-        self.assertEqual(rv.status_code, 403)
-        response = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 403
+        response = _json(rv)
         expected_response = {"message": "Forbidden"}
-        self.assertEqual(response, expected_response)
-
-        for chart in charts:
-            db.session.delete(chart)
-        db.session.delete(owned_chart)
-        db.session.delete(user_alpha1)
-        db.session.delete(user_alpha2)
-        db.session.commit()
+        assert response == expected_response
 
     @pytest.mark.usefixtures(
-        "load_world_bank_dashboard_with_slices",
-        "load_birth_names_dashboard_with_slices",
+        "load_world_bank_dashboard_with_slices_class_scope",
+        "load_birth_names_dashboard_with_slices_class_scope",
     )
     def test_create_chart(self):
         """
         Chart API: Test create chart
         """
         dashboards_ids = get_dashboards_ids(db, ["world_health", "births"])
-        admin_id = self.get_user("admin").id
+        admin_id = self.get_user_id("admin")
         chart_data = {
             "slice_name": "name1",
             "description": "description1",
@@ -471,11 +721,10 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = "api/v1/chart/"
         rv = self.post_assert_metric(uri, chart_data, "post")
-        self.assertEqual(rv.status_code, 201)
-        data = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 201
+        data = _json(rv)
         model = db.session.query(Slice).get(data.get("id"))
-        db.session.delete(model)
-        db.session.commit()
+        assert model is not None
 
     def test_create_simple_chart(self):
         """
@@ -489,11 +738,10 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = "api/v1/chart/"
         rv = self.post_assert_metric(uri, chart_data, "post")
-        self.assertEqual(rv.status_code, 201)
-        data = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 201
+        data = _json(rv)
         model = db.session.query(Slice).get(data.get("id"))
-        db.session.delete(model)
-        db.session.commit()
+        assert model is not None
 
     def test_create_chart_validate_owners(self):
         """
@@ -508,10 +756,10 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = "api/v1/chart/"
         rv = self.post_assert_metric(uri, chart_data, "post")
-        self.assertEqual(rv.status_code, 422)
-        response = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 422
+        response = _json(rv)
         expected_response = {"message": {"owners": ["Owners are invalid"]}}
-        self.assertEqual(response, expected_response)
+        assert response == expected_response
 
     def test_create_chart_validate_params(self):
         """
@@ -526,7 +774,7 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = "api/v1/chart/"
         rv = self.post_assert_metric(uri, chart_data, "post")
-        self.assertEqual(rv.status_code, 400)
+        assert rv.status_code == 400
 
     def test_create_chart_validate_datasource(self):
         """
@@ -539,31 +787,26 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
             "datasource_type": "unknown",
         }
         rv = self.post_assert_metric("/api/v1/chart/", chart_data, "post")
-        self.assertEqual(rv.status_code, 400)
-        response = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(
-            response,
-            {
-                "message": {
-                    "datasource_type": [
-                        "Must be one of: sl_table, table, dataset, query, saved_query, view."
-                    ]
-                }
-            },
-        )
+        assert rv.status_code == 400
+        response = _json(rv)
+        assert response == {
+            "message": {
+                "datasource_type": [
+                    "Must be one of: sl_table, table, dataset, query, saved_query, view."
+                ]
+            }
+        }
         chart_data = {
             "slice_name": "title1",
             "datasource_id": 0,
             "datasource_type": "table",
         }
         rv = self.post_assert_metric("/api/v1/chart/", chart_data, "post")
-        self.assertEqual(rv.status_code, 422)
-        response = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(
-            response, {"message": {"datasource_id": ["Datasource does not exist"]}}
-        )
+        assert rv.status_code == 422
+        response = _json(rv)
+        assert response == {"message": {"datasource_id": ["Datasource does not exist"]}}
 
-    @pytest.mark.usefixtures("load_world_bank_dashboard_with_slices")
+    @pytest.mark.usefixtures("load_world_bank_dashboard_with_slices_class_scope")
     def test_create_chart_validate_user_is_dashboard_owner(self):
         """
         Chart API: Test create validate user is dashboard owner
@@ -581,24 +824,23 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="alpha")
         uri = "api/v1/chart/"
         rv = self.post_assert_metric(uri, chart_data, "post")
-        self.assertEqual(rv.status_code, 403)
-        response = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(
-            response,
-            {"message": "Changing one or more of these dashboards is forbidden"},
-        )
+        assert rv.status_code == 403
+        response = _json(rv)
+        assert response == {
+            "message": "Changing one or more of these dashboards is forbidden"
+        }
 
-    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices_class_scope")
     def test_update_chart(self):
         """
         Chart API: Test update
         """
-        schema = get_example_default_schema()
+        schema = cached_example_default_schema()
         full_table_name = f"{schema}.birth_names" if schema else "birth_names"
 
         admin = self.get_user("admin")
         gamma = self.get_user("gamma")
-        birth_names_table_id = SupersetTestCase.get_table(name="birth_names").id
+        birth_names_table_id = SupersetTestCase.get_table_id(name="birth_names")
         chart_id = self.insert_chart(
             "title", [admin.id], birth_names_table_id, admin
         ).id
@@ -619,121 +861,110 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = f"api/v1/chart/{chart_id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
+        assert rv.status_code == 200
         model = db.session.query(Slice).get(chart_id)
         related_dashboard = db.session.query(Dashboard).filter_by(slug="births").first()
-        self.assertEqual(model.created_by, admin)
-        self.assertEqual(model.slice_name, "title1_changed")
-        self.assertEqual(model.description, "description1")
-        self.assertNotIn(admin, model.owners)
-        self.assertIn(gamma, model.owners)
-        self.assertEqual(model.viz_type, "viz_type1")
-        self.assertEqual(model.params, """{"a": 1}""")
-        self.assertEqual(model.cache_timeout, 1000)
-        self.assertEqual(model.datasource_id, birth_names_table_id)
-        self.assertEqual(model.datasource_type, "table")
-        self.assertEqual(model.datasource_name, full_table_name)
-        self.assertEqual(model.certified_by, "Mario Rossi")
-        self.assertEqual(model.certification_details, "Edited certification")
-        self.assertIn(model.id, [slice.id for slice in related_dashboard.slices])
-        db.session.delete(model)
-        db.session.commit()
-
-    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+        assert model.created_by == admin
+        assert model.slice_name == "title1_changed"
+        assert model.description == "description1"
+        owner_ids = _owner_ids(chart_id)
+        assert admin.id not in owner_ids
+        assert gamma.id in owner_ids
+        assert model.viz_type == "viz_type1"
+        assert model.params == """{"a": 1}"""
+        assert model.cache_timeout == 1000
+        assert model.datasource_id == birth_names_table_id
+        assert model.datasource_type == "table"
+        assert model.datasource_name == full_table_name
+        assert model.certified_by == "Mario Rossi"
+        assert model.certification_details == "Edited certification"
+        assert model.id in [slice.id for slice in related_dashboard.slices]
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices_class_scope")
     def test_chart_get_list_no_username(self):
         """
         Chart API: Tests that no username is returned
         """
-        admin = self.get_user("admin")
-        birth_names_table_id = SupersetTestCase.get_table(name="birth_names").id
-        chart_id = self.insert_chart("title", [admin.id], birth_names_table_id).id
+        admin_id = self.get_user_id("admin")
+        birth_names_table_id = SupersetTestCase.get_table_id(name="birth_names")
+        chart_id = self.insert_chart("title", [admin_id], birth_names_table_id).id
         chart_data = {
             "slice_name": (new_name := "title1_changed"),
-            "owners": [admin.id],
+            "owners": [admin_id],
         }
         self.login(username="admin")
         uri = f"api/v1/chart/{chart_id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
+        assert rv.status_code == 200
         model = db.session.query(Slice).get(chart_id)
 
         response = self.get_assert_metric("api/v1/chart/", "get_list")
-        res = json.loads(response.data.decode("utf-8"))["result"]
+        res = _json(response)["result"]
 
         current_chart = [d for d in res if d["id"] == chart_id][0]
-        self.assertEqual(current_chart["slice_name"], new_name)
-        self.assertNotIn("username", current_chart["changed_by"].keys())
-        self.assertNotIn("username", current_chart["owners"][0].keys())
-
-        db.session.delete(model)
-        db.session.commit()
+        assert current_chart["slice_name"] == new_name
+        assert "username" not in current_chart["changed_by"].keys()
+        assert "username" not in current_chart["owners"][0].keys()
 
-    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices_class_scope")
     def test_chart_get_no_username(self):
         """
         Chart API: Tests that no username is returned
         """
-        admin = self.get_user("admin")
-        birth_names_table_id = SupersetTestCase.get_table(name="birth_names").id
-        chart_id = self.insert_chart("title", [admin.id], birth_names_table_id).id
+        admin_id = self.get_user_id("admin")
+        birth_names_table_id = SupersetTestCase.get_table_id(name="birth_names")
+        chart_id = self.insert_chart("title", [admin_id], birth_names_table_id).id
         chart_data = {
             "slice_name": (new_name := "title1_changed"),
-            "owners": [admin.id],
+            "owners": [admin_id],
         }
         self.login(username="admin")
         uri = f"api/v1/chart/{chart_id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
+        assert rv.status_code == 200
         model = db.session.query(Slice).get(chart_id)
 
         response = self.get_assert_metric(uri, "get")
-        res = json.loads(response.data.decode("utf-8"))["result"]
+        res = _json(response)["result"]
 
-        self.assertEqual(res["slice_name"], new_name)
-        self.assertNotIn("username", res["owners"][0].keys())
-
-        db.session.delete(model)
-        db.session.commit()
+        assert res["slice_name"] == new_name
+        assert "username" not in res["owners"][0].keys()
 
     def test_update_chart_new_owner_not_admin(self):
         """
         Chart API: Test update set new owner implicitly adds logged in owner
         """
-        gamma = self.get_user("gamma_no_csv")
-        alpha = self.get_user("alpha")
-        chart_id = self.insert_chart("title", [gamma.id], 1).id
+        gamma_no_csv_id = self.get_user_id("gamma_no_csv")
+        alpha_id = self.get_user_id("alpha")
+        chart_id = self.insert_chart("title", [gamma_no_csv_id], 1).id
         chart_data = {
             "slice_name": (new_name := "title1_changed"),
-            "owners": [alpha.id],
+            "owners": [alpha_id],
         }
-        self.login(username=gamma.username)
+        self.login(username="gamma_no_csv")
         uri = f"api/v1/chart/{chart_id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
         assert rv.status_code == 200
         model = db.session.query(Slice).get(chart_id)
         assert model.slice_name == new_name
-        assert alpha in model.owners
-        assert gamma in model.owners
-        db.session.delete(model)
-        db.session.commit()
+        owner_ids = _owner_ids(chart_id)
+        assert alpha_id in owner_ids
+        assert gamma_no_csv_id in owner_ids
 
     def test_update_chart_new_owner_admin(self):
         """
         Chart API: Test update set new owner as admin to other than current user
         """
-        gamma = self.get_user("gamma")
-        admin = self.get_user("admin")
-        chart_id = self.insert_chart("title", [admin.id], 1).id
-        chart_data = {"slice_name": "title1_changed", "owners": [gamma.id]}
+        gamma_id = self.get_user_id("gamma")
+        chart_id = self.insert_chart("title", [self.get_user_id("admin")], 1).id
+        chart_data = {"slice_name": "title1_changed", "owners": [gamma_id]}
         self.login(username="admin")
         uri = f"api/v1/chart/{chart_id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
-        model = db.session.query(Slice).get(chart_id)
-        self.assertNotIn(admin, model.owners)
-        self.assertIn(gamma, model.owners)
-        db.session.delete(model)
-        db.session.commit()
+        assert rv.status_code == 200
+        owner_ids = _owner_ids(chart_id)
+        assert self.get_user_id("admin") not in owner_ids
+        assert gamma_id in owner_ids
 
     @pytest.mark.usefixtures("add_dashboard_to_chart")
     def test_update_chart_preserve_ownership(self):
@@ -743,12 +974,11 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         chart_data = {
             "slice_name": "title1_changed",
         }
-        admin = self.get_user("admin")
         self.login(username="admin")
         uri = f"api/v1/chart/{self.chart.id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
-        self.assertEqual([admin], self.chart.owners)
+        assert rv.status_code == 200
+        assert {self.get_user_id("admin")} == _owner_ids(self.chart.id)
 
     @pytest.mark.usefixtures("add_dashboard_to_chart")
     def test_update_chart_clear_owner_list(self):
@@ -756,33 +986,29 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         Chart API: Test update chart admin can clear owner list
         """
         chart_data = {"slice_name": "title1_changed", "owners": []}
-        admin = self.get_user("admin")
         self.login(username="admin")
         uri = f"api/v1/chart/{self.chart.id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
-        self.assertEqual([], self.chart.owners)
+        assert rv.status_code == 200
+        assert [] == self.chart.owners
 
     def test_update_chart_populate_owner(self):
         """
         Chart API: Test update admin can update chart with
         no owners to a different owner
         """
-        gamma = self.get_user("gamma")
-        admin = self.get_user("admin")
+        gamma_id = self.get_user_id("gamma")
         chart_id = self.insert_chart("title", [], 1).id
         model = db.session.query(Slice).get(chart_id)
-        self.assertEqual(model.owners, [])
-        chart_data = {"owners": [gamma.id]}
+        assert model.owners == []
+        chart_data = {"owners": [gamma_id]}
         self.login(username="admin")
         uri = f"api/v1/chart/{chart_id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
-        model_updated = db.session.query(Slice).get(chart_id)
-        self.assertNotIn(admin, model_updated.owners)
-        self.assertIn(gamma, model_updated.owners)
-        db.session.delete(model_updated)
-        db.session.commit()
+        assert rv.status_code == 200
+        owner_ids = _owner_ids(chart_id)
+        assert self.get_user_id("admin") not in owner_ids
+        assert gamma_id in owner_ids
 
     @pytest.mark.usefixtures("add_dashboard_to_chart")
     def test_update_chart_new_dashboards(self):
@@ -796,9 +1022,9 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = f"api/v1/chart/{self.chart.id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
-        self.assertIn(self.new_dashboard, self.chart.dashboards)
-        self.assertNotIn(self.original_dashboard, self.chart.dashboards)
+        assert rv.status_code == 200
+        assert self.new_dashboard in self.chart.dashboards
+        assert self.original_dashboard not in self.chart.dashboards
 
     @pytest.mark.usefixtures("add_dashboard_to_chart")
     def test_not_update_chart_none_dashboards(self):
@@ -809,42 +1035,30 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = f"api/v1/chart/{self.chart.id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
-        self.assertIn(self.original_dashboard, self.chart.dashboards)
-        self.assertEqual(len(self.chart.dashboards), 1)
+        assert rv.status_code == 200
+        assert self.original_dashboard in self.chart.dashboards
+        assert len(self.chart.dashboards) == 1
 
+    @pytest.mark.usefixtures("alpha_users")
     def test_update_chart_not_owned(self):
         """
         Chart API: Test update not owned
         """
-        user_alpha1 = self.create_user(
-            "alpha1", "password", "Alpha", email="alpha1@superset.org"
-        )
-        user_alpha2 = self.create_user(
-            "alpha2", "password", "Alpha", email="alpha2@superset.org"
-        )
-        chart = self.insert_chart("title", [user_alpha1.id], 1)
+        chart = self.insert_chart("title", [self.get_user_id("alpha1")], 1)
 
         self.login(username="alpha2", password="password")
         chart_data = {"slice_name": "title1_changed"}
         uri = f"api/v1/chart/{chart.id}"
         rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 403)
-        db.session.delete(chart)
-        db.session.delete(user_alpha1)
-        db.session.delete(user_alpha2)
-        db.session.commit()
+        assert rv.status_code == 403
 
+    @pytest.mark.usefixtures("alpha_users")
     def test_update_chart_linked_with_not_owned_dashboard(self):
         """
         Chart API: Test update chart which is linked to not owned dashboard
         """
-        user_alpha1 = self.create_user(
-            "alpha1", "password", "Alpha", email="alpha1@superset.org"
-        )
-        user_alpha2 = self.create_user(
-            "alpha2", "password", "Alpha", email="alpha2@superset.org"
-        )
+        user_alpha1 = self.get_user("alpha1")
+        user_alpha2 = self.get_user("alpha2")
         chart = self.insert_chart("title", [user_alpha1.id], 1)
 
         original_dashboard = Dashboard()
@@ -864,65 +1078,55 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         db.session.add(new_dashboard)
 
         self.login(username="alpha1", password="password")
-        chart_data_with_invalid_dashboard = {
-            "slice_name": "title1_changed",
-            "dashboards": [original_dashboard.id, 0],
-        }
-        chart_data = {
-            "slice_name": "title1_changed",
-            "dashboards": [original_dashboard.id, new_dashboard.id],
-        }
         uri = f"api/v1/chart/{chart.id}"
 
-        rv = self.put_assert_metric(uri, chart_data_with_invalid_dashboard, "put")
-        self.assertEqual(rv.status_code, 422)
-        response = json.loads(rv.data.decode("utf-8"))
-        expected_response = {"message": {"dashboards": ["Dashboards do not exist"]}}
-        self.assertEqual(response, expected_response)
-
-        rv = self.put_assert_metric(uri, chart_data, "put")
-        self.assertEqual(rv.status_code, 200)
-
-        db.session.delete(chart)
-        db.session.delete(original_dashboard)
-        db.session.delete(new_dashboard)
-        db.session.delete(user_alpha1)
-        db.session.delete(user_alpha2)
-        db.session.commit()
+        # unittest-style tests cannot use pytest.mark.parametrize; sub-tests
+        # share the user/dashboard/chart setup above the same way
+        cases = [
+            ([original_dashboard.id, 0], 422),
+            ([original_dashboard.id, new_dashboard.id], 200),
+        ]
+        for dashboard_ids, expected_status in cases:
+            with self.subTest(expected_status=expected_status):
+                chart_data = {
+                    "slice_name": "title1_changed",
+                    "dashboards": dashboard_ids,
+                }
+                rv = self.put_assert_metric(uri, chart_data, "put")
+                assert rv.status_code == expected_status
+                if expected_status == 422:
+                    response = _json(rv)
+                    expected_response = {
+                        "message": {"dashboards": ["Dashboards do not exist"]}
+                    }
+                    assert response == expected_response
 
     def test_update_chart_validate_datasource(self):
         """
         Chart API: Test update validate datasource
         """
-        admin = self.get_user("admin")
-        chart = self.insert_chart("title", owners=[admin.id], datasource_id=1)
+        chart = self.insert_chart(
+            "title", owners=[self.get_user_id("admin")], datasource_id=1
+        )
         self.login(username="admin")
 
         chart_data = {"datasource_id": 1, "datasource_type": "unknown"}
         rv = self.put_assert_metric(f"/api/v1/chart/{chart.id}", chart_data, "put")
-        self.assertEqual(rv.status_code, 400)
-        response = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(
-            response,
-            {
-                "message": {
-                    "datasource_type": [
-                        "Must be one of: sl_table, table, dataset, query, saved_query, view."
-                    ]
-                }
-            },
-        )
+        assert rv.status_code == 400
+        response = _json(rv)
+        assert response == {
+            "message": {
+                "datasource_type": [
+                    "Must be one of: sl_table, table, dataset, query, saved_query, view."
+                ]
+            }
+        }
 
         chart_data = {"datasource_id": 0, "datasource_type": "table"}
         rv = self.put_assert_metric(f"/api/v1/chart/{chart.id}", chart_data, "put")
-        self.assertEqual(rv.status_code, 422)
-        response = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(
-            response, {"message": {"datasource_id": ["Datasource does not exist"]}}
-        )
-
-        db.session.delete(chart)
-        db.session.commit()
+        assert rv.status_code == 422
+        response = _json(rv)
+        assert response == {"message": {"datasource_id": ["Datasource does not exist"]}}
 
     def test_update_chart_validate_owners(self):
         """
@@ -937,22 +1141,21 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = f"api/v1/chart/"
         rv = self.client.post(uri, json=chart_data)
-        self.assertEqual(rv.status_code, 422)
-        response = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 422
+        response = _json(rv)
         expected_response = {"message": {"owners": ["Owners are invalid"]}}
-        self.assertEqual(response, expected_response)
+        assert response == expected_response
 
-    @pytest.mark.usefixtures("load_world_bank_dashboard_with_slices")
+    @pytest.mark.usefixtures("load_world_bank_dashboard_with_slices_class_scope")
     def test_get_chart(self):
         """
         Chart API: Test get chart
         """
-        admin = self.get_user("admin")
-        chart = self.insert_chart("title", [admin.id], 1)
+        chart = self.insert_chart("title", [self.get_user_id("admin")], 1)
         self.login(username="admin")
         uri = f"api/v1/chart/{chart.id}"
         rv = self.get_assert_metric(uri, "get")
-        self.assertEqual(rv.status_code, 200)
+        assert rv.status_code == 200
         expected_result = {
             "cache_timeout": None,
             "certified_by": None,
@@ -973,22 +1176,17 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
             "query_context": None,
             "is_managed_externally": False,
         }
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertIn("changed_on_delta_humanized", data["result"])
-        self.assertIn("id", data["result"])
-        self.assertIn("thumbnail_url", data["result"])
-        self.assertIn("url", data["result"])
-        for key, value in data["result"].items():
-            # We can't assert timestamp values or id/urls
-            if key not in (
-                "changed_on_delta_humanized",
-                "id",
-                "thumbnail_url",
-                "url",
-            ):
-                self.assertEqual(value, expected_result[key])
-        db.session.delete(chart)
-        db.session.commit()
+        data = _json(rv)
+        # the volatile keys (timestamps, ids, urls) only need to be present;
+        # everything else must match expected_result exactly
+        volatile_keys = {"changed_on_delta_humanized", "id", "thumbnail_url", "url"}
+        assert volatile_keys <= data["result"].keys()
+        result = {
+            key: value
+            for key, value in data["result"].items()
+            if key not in volatile_keys
+        }
+        assert result == expected_result
 
     def test_get_chart_not_found(self):
         """
@@ -998,9 +1196,9 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = f"api/v1/chart/{chart_id}"
         rv = self.get_assert_metric(uri, "get")
-        self.assertEqual(rv.status_code, 404)
+        assert rv.status_code == 404
 
-    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices_class_scope")
     def test_get_chart_no_data_access(self):
         """
         Chart API: Test get chart without data access
@@ -1013,24 +1211,27 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         )
         uri = f"api/v1/chart/{chart_no_access.id}"
         rv = self.client.get(uri)
-        self.assertEqual(rv.status_code, 404)
+        assert rv.status_code == 404
 
     @pytest.mark.usefixtures(
         "load_energy_table_with_slice",
-        "load_birth_names_dashboard_with_slices",
+        "load_birth_names_dashboard_with_slices_class_scope",
         "load_unicode_dashboard_with_slice",
-        "load_world_bank_dashboard_with_slices",
+        "load_world_bank_dashboard_with_slices_class_scope",
     )
     def test_get_charts(self):
         """
         Chart API: Test get charts
         """
         self.login(username="admin")
+        # class-scoped fixtures may have left charts visible to this test, so
+        # derive the expected count instead of hard-coding it
+        expected_count = db.session.query(Slice).count()
         uri = f"api/v1/chart/"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data["count"], 33)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert data["count"] == expected_count
 
     @pytest.mark.usefixtures("load_energy_table_with_slice", "add_dashboard_to_chart")
     def test_get_charts_dashboards(self):
@@ -1045,8 +1246,8 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         }
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 200
+        data = _json(rv)
         assert data["result"][0]["dashboards"] == [
             {
                 "id": self.original_dashboard.id,
@@ -1071,8 +1272,8 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         }
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 200
+        data = _json(rv)
         result = data["result"]
         assert len(result) == 1
         assert result[0]["slice_name"] == self.chart.slice_name
@@ -1081,8 +1282,9 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         """
         Dashboard API: Test get charts changed on
         """
-        admin = self.get_user("admin")
-        chart = self.insert_chart("foo_a", [admin.id], 1, description="ZY_bar")
+        chart = self.insert_chart(
+            "foo_a", [self.get_user_id("admin")], 1, description="ZY_bar"
+        )
 
         self.login(username="admin")
 
@@ -1093,69 +1295,62 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
 
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
+        assert rv.status_code == 200
+        data = _json(rv)
         assert data["result"][0]["changed_on_delta_humanized"] in (
             "now",
             "a second ago",
         )
 
-        # rollback changes
-        db.session.delete(chart)
-        db.session.commit()
-
     @pytest.mark.usefixtures(
-        "load_world_bank_dashboard_with_slices",
-        "load_birth_names_dashboard_with_slices",
+        "load_world_bank_dashboard_with_slices_class_scope",
+        "load_birth_names_dashboard_with_slices_class_scope",
     )
     def test_get_charts_filter(self):
         """
         Chart API: Test get charts filter
         """
         self.login(username="admin")
+        expected_count = (
+            db.session.query(Slice).filter(Slice.slice_name.ilike("G%")).count()
+        )
         arguments = {"filters": [{"col": "slice_name", "opr": "sw", "value": "G"}]}
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data["count"], 5)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert data["count"] == expected_count
 
-    @pytest.fixture()
+    @pytest.fixture(scope="class")
     def load_energy_charts(self):
-        with app.app_context():
-            admin = self.get_user("admin")
-            energy_table = (
-                db.session.query(SqlaTable)
-                .filter_by(table_name="energy_usage")
-                .one_or_none()
-            )
-            energy_table_id = 1
-            if energy_table:
-                energy_table_id = energy_table.id
-            chart1 = self.insert_chart(
-                "foo_a", [admin.id], energy_table_id, description="ZY_bar"
-            )
-            chart2 = self.insert_chart(
-                "zy_foo", [admin.id], energy_table_id, description="desc1"
-            )
-            chart3 = self.insert_chart(
-                "foo_b", [admin.id], energy_table_id, description="desc1zy_"
-            )
-            chart4 = self.insert_chart(
-                "foo_c", [admin.id], energy_table_id, viz_type="viz_zy_"
-            )
-            chart5 = self.insert_chart(
-                "bar", [admin.id], energy_table_id, description="foo"
-            )
+        admin_id = self.get_user_id("admin")
+        energy_table = (
+            db.session.query(SqlaTable)
+            .filter_by(table_name="energy_usage")
+            .one_or_none()
+        )
+        energy_table_id = 1
+        if energy_table:
+            energy_table_id = energy_table.id
+        charts = self._bulk_insert_charts(
+            ["foo_a", "zy_foo", "foo_b", "foo_c", "bar"],
+            [admin_id],
+            energy_table_id,
+            extra_fields={
+                "foo_a": {"description": "ZY_bar"},
+                "zy_foo": {"description": "desc1"},
+                "foo_b": {"description": "desc1zy_"},
+                "foo_c": {"viz_type": "viz_zy_"},
+                "bar": {"description": "foo"},
+            },
+        )
+        chart_ids = [chart.id for chart in charts]
 
-            yield
-            # rollback changes
-            db.session.delete(chart1)
-            db.session.delete(chart2)
-            db.session.delete(chart3)
-            db.session.delete(chart4)
-            db.session.delete(chart5)
-            db.session.commit()
+        yield
+
+        # class-scoped data is committed outside the per-test savepoint, so it
+        # has to be deleted explicitly
+        _bulk_delete_charts(chart_ids)
 
     @pytest.mark.usefixtures("load_energy_charts")
     def test_get_charts_custom_filter(self):
@@ -1163,19 +1358,12 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         Chart API: Test get charts custom filter
         """
 
-        arguments = {
-            "filters": [{"col": "slice_name", "opr": "chart_all_text", "value": "zy_"}],
-            "order_column": "slice_name",
-            "order_direction": "asc",
-            "keys": ["none"],
-            "columns": ["slice_name", "description", "viz_type"],
-        }
         self.login(username="admin")
-        uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
+        uri = f"api/v1/chart/?q={CHART_ALL_TEXT_ZY_QUERY}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data["count"], 4)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert data["count"] == 4
 
         expected_response = [
             {"description": "ZY_bar", "slice_name": "foo_a", "viz_type": None},
@@ -1183,36 +1371,22 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
             {"description": None, "slice_name": "foo_c", "viz_type": "viz_zy_"},
             {"description": "desc1", "slice_name": "zy_foo", "viz_type": None},
         ]
-        for index, item in enumerate(data["result"]):
-            self.assertEqual(
-                item["description"], expected_response[index]["description"]
-            )
-            self.assertEqual(item["slice_name"], expected_response[index]["slice_name"])
-            self.assertEqual(item["viz_type"], expected_response[index]["viz_type"])
+        assert [
+            {key: item[key] for key in ("description", "slice_name", "viz_type")}
+            for item in data["result"]
+        ] == expected_response
 
     @pytest.mark.usefixtures("load_energy_table_with_slice", "load_energy_charts")
     def test_admin_gets_filtered_energy_slices(self):
         # test filtering on datasource_name
-        arguments = {
-            "filters": [
-                {
-                    "col": "slice_name",
-                    "opr": "chart_all_text",
-                    "value": "energy",
-                }
-            ],
-            "keys": ["none"],
-            "columns": ["slice_name", "description", "table.table_name"],
-        }
         self.login(username="admin")
 
-        uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
+        uri = f"api/v1/chart/?q={CHART_ALL_TEXT_ENERGY_QUERY}"
         rv = self.get_assert_metric(uri, "get_list")
         data = rv.json
         assert rv.status_code == 200
         assert data["count"] > 0
         for chart in data["result"]:
-            print(chart)
             assert (
                 "energy"
                 in " ".join(
@@ -1241,12 +1415,15 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
 
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data["count"], CHARTS_FIXTURE_COUNT)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert data["count"] == CHARTS_FIXTURE_COUNT
 
     @pytest.mark.usefixtures("create_charts")
     def test_gets_not_certified_charts_filter(self):
+        expected_count = (
+            db.session.query(Slice).filter(Slice.certified_by.is_(None)).count()
+        )
         arguments = {
             "filters": [
                 {
@@ -1262,9 +1439,9 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
 
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data["count"], 17)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert data["count"] == expected_count
 
     @pytest.mark.usefixtures("load_energy_charts")
     def test_user_gets_none_filtered_energy_slices(self):
@@ -1284,25 +1461,36 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="gamma")
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data["count"], 0)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert data["count"] == 0
 
     @pytest.mark.usefixtures("create_charts")
     def test_get_charts_favorite_filter(self):
         """
         Chart API: Test get charts favorite filter
         """
-        admin = self.get_user("admin")
-        users_favorite_query = db.session.query(FavStar.obj_id).filter(
-            and_(FavStar.user_id == admin.id, FavStar.class_name == "slice")
-        )
-        expected_models = (
-            db.session.query(Slice)
-            .filter(and_(Slice.id.in_(users_favorite_query)))
+        # fetch the favorite ids and all slices once and partition in memory
+        # instead of running the subquery-filtered ORM query twice
+        users_favorite_ids = {
+            obj_id
+            for (obj_id,) in db.session.query(FavStar.obj_id).filter(
+                and_(
+                    FavStar.user_id == self.get_user_id("admin"),
+                    FavStar.class_name == "slice",
+                )
+            )
+        }
+        all_slices = (
+            db.session.query(Slice.id, Slice.slice_name)
             .order_by(Slice.slice_name.asc())
             .all()
         )
+        expected_names = [
+            slice_name
+            for slice_id, slice_name in all_slices
+            if slice_id in users_favorite_ids
+        ]
 
         arguments = {
             "filters": [{"col": "id", "opr": "chart_is_favorite", "value": True}],
@@ -1314,35 +1502,30 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
+        data = _json(rv)
         assert rv.status_code == 200
-        assert len(expected_models) == data["count"]
+        assert len(expected_names) == data["count"]
 
-        for i, expected_model in enumerate(expected_models):
-            assert expected_model.slice_name == data["result"][i]["slice_name"]
+        for i, expected_name in enumerate(expected_names):
+            assert expected_name == data["result"][i]["slice_name"]
 
         # Test not favorite charts
-        expected_models = (
-            db.session.query(Slice)
-            .filter(and_(~Slice.id.in_(users_favorite_query)))
-            .order_by(Slice.slice_name.asc())
-            .all()
-        )
         arguments["filters"][0]["value"] = False
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
+        data = _json(rv)
         assert rv.status_code == 200
-        assert len(expected_models) == data["count"]
+        assert len(all_slices) - len(expected_names) == data["count"]
 
     @pytest.mark.usefixtures("create_charts_created_by_gamma")
     def test_get_charts_created_by_me_filter(self):
         """
         Chart API: Test get charts with created by me special filter
         """
-        gamma_user = self.get_user("gamma")
         expected_models = (
-            db.session.query(Slice).filter(Slice.created_by_fk == gamma_user.id).all()
+            db.session.query(Slice)
+            .filter(Slice.created_by_fk == self.get_user_id("gamma"))
+            .all()
         )
         arguments = {
             "filters": [
@@ -1356,7 +1539,7 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="gamma")
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
+        data = _json(rv)
         assert rv.status_code == 200
         assert len(expected_models) == data["count"]
         for i, expected_model in enumerate(expected_models):
@@ -1367,13 +1550,12 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         """
         Dataset API: Test get current user favorite stars
         """
-        admin = self.get_user("admin")
         users_favorite_ids = [
             star.obj_id
             for star in db.session.query(FavStar.obj_id)
             .filter(
                 and_(
-                    FavStar.user_id == admin.id,
+                    FavStar.user_id == self.get_user_id("admin"),
                     FavStar.class_name == FavStarClassName.CHART,
                 )
             )
@@ -1381,84 +1563,56 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         ]
 
         assert users_favorite_ids
-        arguments = [s.id for s in db.session.query(Slice.id).all()]
+        # create_charts already exposes its chart ids on the class; query
+        # the status of those instead of scanning the whole slices table
+        arguments = list(self.chart_ids_by_name.values())
         self.login(username="admin")
         uri = f"api/v1/chart/favorite_status/?q={prison.dumps(arguments)}"
         rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
+        data = _json(rv)
         assert rv.status_code == 200
         for res in data["result"]:
             if res["id"] in users_favorite_ids:
                 assert res["value"]
 
+    @pytest.mark.usefixtures("tmp_perm_chart")
     def test_add_favorite(self):
         """
         Dataset API: Test add chart to favorites
         """
-        chart = Slice(
-            id=100,
-            datasource_id=1,
-            datasource_type="table",
-            datasource_name="tmp_perm_table",
-            slice_name="slice_name",
-        )
-        db.session.add(chart)
-        db.session.commit()
-
+        chart_id = self.tmp_perm_chart_id
         self.login(username="admin")
-        uri = f"api/v1/chart/favorite_status/?q={prison.dumps([chart.id])}"
-        rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
-        for res in data["result"]:
-            assert res["value"] is False
+        # assert the favorite state directly in the database instead of
+        # paying a favorite_status round-trip before and after the POST
+        favorite_filter = dict(
+            user_id=self.get_user_id("admin"), obj_id=chart_id, class_name="slice"
+        )
+        assert db.session.query(FavStar).filter_by(**favorite_filter).count() == 0
 
-        uri = f"api/v1/chart/{chart.id}/favorites/"
+        uri = f"api/v1/chart/{chart_id}/favorites/"
         self.client.post(uri)
 
-        uri = f"api/v1/chart/favorite_status/?q={prison.dumps([chart.id])}"
-        rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
-        for res in data["result"]:
-            assert res["value"] is True
-
-        db.session.delete(chart)
-        db.session.commit()
+        assert db.session.query(FavStar).filter_by(**favorite_filter).count() == 1
 
+    @pytest.mark.usefixtures("tmp_perm_chart")
     def test_remove_favorite(self):
         """
         Dataset API: Test remove chart from favorites
         """
-        chart = Slice(
-            id=100,
-            datasource_id=1,
-            datasource_type="table",
-            datasource_name="tmp_perm_table",
-            slice_name="slice_name",
-        )
-        db.session.add(chart)
-        db.session.commit()
-
+        chart_id = self.tmp_perm_chart_id
         self.login(username="admin")
-        uri = f"api/v1/chart/{chart.id}/favorites/"
+        favorite_filter = dict(
+            user_id=self.get_user_id("admin"), obj_id=chart_id, class_name="slice"
+        )
+        uri = f"api/v1/chart/{chart_id}/favorites/"
         self.client.post(uri)
 
-        uri = f"api/v1/chart/favorite_status/?q={prison.dumps([chart.id])}"
-        rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
-        for res in data["result"]:
-            assert res["value"] is True
+        assert db.session.query(FavStar).filter_by(**favorite_filter).count() == 1
 
-        uri = f"api/v1/chart/{chart.id}/favorites/"
+        uri = f"api/v1/chart/{chart_id}/favorites/"
         self.client.delete(uri)
 
-        uri = f"api/v1/chart/favorite_status/?q={prison.dumps([chart.id])}"
-        rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
-        for res in data["result"]:
-            assert res["value"] is False
-
-        db.session.delete(chart)
-        db.session.commit()
+        assert db.session.query(FavStar).filter_by(**favorite_filter).count() == 0
 
     def test_get_time_range(self):
         """
@@ -1468,9 +1622,9 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         humanize_time_range = "100 years ago : now"
         uri = f"api/v1/time_range/?q={prison.dumps(humanize_time_range)}"
         rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(rv.status_code, 200)
-        self.assertEqual(len(data["result"]), 3)
+        data = _json(rv)
+        assert rv.status_code == 200
+        assert len(data["result"]) == 3
 
     def test_query_form_data(self):
         """
@@ -1480,37 +1634,36 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         slice = db.session.query(Slice).first()
         uri = f"api/v1/form_data/?slice_id={slice.id if slice else None}"
         rv = self.client.get(uri)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(rv.status_code, 200)
-        self.assertEqual(rv.content_type, "application/json")
+        data = _json(rv)
+        assert rv.status_code == 200
+        assert rv.content_type == "application/json"
         if slice:
-            self.assertEqual(data["slice_id"], slice.id)
+            assert data["slice_id"] == slice.id
 
-    @pytest.mark.usefixtures(
-        "load_unicode_dashboard_with_slice",
-        "load_energy_table_with_slice",
-        "load_world_bank_dashboard_with_slices",
-        "load_birth_names_dashboard_with_slices",
-    )
+    @pytest.mark.usefixtures("create_charts")
     def test_get_charts_page(self):
         """
         Chart API: Test get charts filter
         """
-        # Assuming we have 33 sample charts
+        # paginate the ``create_charts`` fixtures; other fixtures may leave
+        # charts starting with "name" around, so derive the total from the
+        # database rather than hardcoding it
+        total = db.session.query(Slice).filter(Slice.slice_name.ilike("name%")).count()
         self.login(username="admin")
-        arguments = {"page_size": 10, "page": 0}
+        filters = [{"col": "slice_name", "opr": "sw", "value": "name"}]
+        arguments = {"filters": filters, "page_size": 5, "page": 0}
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.client.get(uri)
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(len(data["result"]), 10)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert len(data["result"]) == 5
 
-        arguments = {"page_size": 10, "page": 3}
+        arguments = {"filters": filters, "page_size": 5, "page": 1}
         uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(len(data["result"]), 3)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert len(data["result"]) == min(total - 5, 5)
 
     def test_get_charts_no_data_access(self):
         """
@@ -1519,15 +1672,16 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="gamma")
         uri = "api/v1/chart/"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data["count"], 0)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert data["count"] == 0
 
+    @pytest.mark.usefixtures("create_charts")
     def test_export_chart(self):
         """
         Chart API: Test export chart
         """
-        example_chart = db.session.query(Slice).all()[0]
+        example_chart = db.session.query(Slice).first()
         argument = [example_chart.id]
         uri = f"api/v1/chart/export/?q={prison.dumps(argument)}"
 
@@ -1536,8 +1690,10 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
 
         assert rv.status_code == 200
 
-        buf = BytesIO(rv.data)
-        assert is_zipfile(buf)
+        # opening the archive only seeks to the end-of-central-directory
+        # record instead of scanning the whole buffer like is_zipfile
+        with ZipFile(BytesIO(rv.data)) as bundle:
+            assert bundle.namelist()
 
     def test_export_chart_not_found(self):
         """
@@ -1551,11 +1707,12 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
 
         assert rv.status_code == 404
 
+    @pytest.mark.usefixtures("create_charts")
     def test_export_chart_gamma(self):
         """
         Chart API: Test export chart has gamma
         """
-        example_chart = db.session.query(Slice).all()[0]
+        example_chart = db.session.query(Slice).first()
         argument = [example_chart.id]
         uri = f"api/v1/chart/export/?q={prison.dumps(argument)}"
 
@@ -1571,18 +1728,21 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = "api/v1/chart/import/"
 
-        buf = self.create_chart_import()
-        form_data = {
-            "formData": (buf, "chart_export.zip"),
-        }
-        rv = self.client.post(uri, data=form_data, content_type="multipart/form-data")
-        response = json.loads(rv.data.decode("utf-8"))
+        rv = self.client.post(
+            uri, data=CHART_IMPORT_BODY, content_type=CHART_IMPORT_CONTENT_TYPE
+        )
+        response = _json(rv)
 
         assert rv.status_code == 200
         assert response == {"message": "OK"}
 
+        # load the database and its tables in one SELECT instead of
+        # lazy-loading the relationship afterwards
         database = (
-            db.session.query(Database).filter_by(uuid=database_config["uuid"]).one()
+            db.session.query(Database)
+            .options(joinedload(Database.tables))
+            .filter_by(uuid=database_config["uuid"])
+            .one()
         )
         assert database.database_name == "imported_database"
 
@@ -1594,13 +1754,6 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         chart = db.session.query(Slice).filter_by(uuid=chart_config["uuid"]).one()
         assert chart.table == dataset
 
-        db.session.delete(chart)
-        db.session.commit()
-        db.session.delete(dataset)
-        db.session.commit()
-        db.session.delete(database)
-        db.session.commit()
-
     def test_import_chart_overwrite(self):
         """
         Chart API: Test import existing chart
@@ -1608,70 +1761,34 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = "api/v1/chart/import/"
 
-        buf = self.create_chart_import()
-        form_data = {
-            "formData": (buf, "chart_export.zip"),
-        }
-        rv = self.client.post(uri, data=form_data, content_type="multipart/form-data")
-        response = json.loads(rv.data.decode("utf-8"))
+        rv = self.client.post(
+            uri, data=CHART_IMPORT_BODY, content_type=CHART_IMPORT_CONTENT_TYPE
+        )
+        response = _json(rv)
 
         assert rv.status_code == 200
         assert response == {"message": "OK"}
 
         # import again without overwrite flag
-        buf = self.create_chart_import()
-        form_data = {
-            "formData": (buf, "chart_export.zip"),
-        }
-        rv = self.client.post(uri, data=form_data, content_type="multipart/form-data")
-        response = json.loads(rv.data.decode("utf-8"))
+        rv = self.client.post(
+            uri, data=CHART_IMPORT_BODY, content_type=CHART_IMPORT_CONTENT_TYPE
+        )
+        response = _json(rv)
 
         assert rv.status_code == 422
-        assert response == {
-            "errors": [
-                {
-                    "message": "Error importing chart",
-                    "error_type": "GENERIC_COMMAND_ERROR",
-                    "level": "warning",
-                    "extra": {
-                        "charts/imported_chart.yaml": "Chart already exists and `overwrite=true` was not passed",
-                        "issue_codes": [
-                            {
-                                "code": 1010,
-                                "message": "Issue 1010 - Superset encountered an error while running a command.",
-                            }
-                        ],
-                    },
-                }
-            ]
-        }
+        assert response == CHART_IMPORT_EXISTS_RESPONSE
 
         # import with overwrite flag
-        buf = self.create_chart_import()
-        form_data = {
-            "formData": (buf, "chart_export.zip"),
-            "overwrite": "true",
-        }
-        rv = self.client.post(uri, data=form_data, content_type="multipart/form-data")
-        response = json.loads(rv.data.decode("utf-8"))
+        rv = self.client.post(
+            uri,
+            data=CHART_IMPORT_OVERWRITE_BODY,
+            content_type=CHART_IMPORT_CONTENT_TYPE,
+        )
+        response = _json(rv)
 
         assert rv.status_code == 200
         assert response == {"message": "OK"}
 
-        # clean up
-        database = (
-            db.session.query(Database).filter_by(uuid=database_config["uuid"]).one()
-        )
-        dataset = database.tables[0]
-        chart = db.session.query(Slice).filter_by(uuid=chart_config["uuid"]).one()
-
-        db.session.delete(chart)
-        db.session.commit()
-        db.session.delete(dataset)
-        db.session.commit()
-        db.session.delete(database)
-        db.session.commit()
-
     def test_import_chart_invalid(self):
         """
         Chart API: Test import invalid chart
@@ -1679,76 +1796,44 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         self.login(username="admin")
         uri = "api/v1/chart/import/"
 
-        buf = BytesIO()
-        with ZipFile(buf, "w") as bundle:
-            with bundle.open("chart_export/metadata.yaml", "w") as fp:
-                fp.write(yaml.safe_dump(dataset_metadata_config).encode())
-            with bundle.open(
-                "chart_export/databases/imported_database.yaml", "w"
-            ) as fp:
-                fp.write(yaml.safe_dump(database_config).encode())
-            with bundle.open("chart_export/datasets/imported_dataset.yaml", "w") as fp:
-                fp.write(yaml.safe_dump(dataset_config).encode())
-            with bundle.open("chart_export/charts/imported_chart.yaml", "w") as fp:
-                fp.write(yaml.safe_dump(chart_config).encode())
-        buf.seek(0)
-
-        form_data = {
-            "formData": (buf, "chart_export.zip"),
-        }
-        rv = self.client.post(uri, data=form_data, content_type="multipart/form-data")
-        response = json.loads(rv.data.decode("utf-8"))
+        rv = self.client.post(
+            uri,
+            data=INVALID_CHART_IMPORT_BODY,
+            content_type=CHART_IMPORT_CONTENT_TYPE,
+        )
+        response = _json(rv)
 
         assert rv.status_code == 422
-        assert response == {
-            "errors": [
-                {
-                    "message": "Error importing chart",
-                    "error_type": "GENERIC_COMMAND_ERROR",
-                    "level": "warning",
-                    "extra": {
-                        "metadata.yaml": {"type": ["Must be equal to Slice."]},
-                        "issue_codes": [
-                            {
-                                "code": 1010,
-                                "message": (
-                                    "Issue 1010 - Superset encountered an "
-                                    "error while running a command."
-                                ),
-                            }
-                        ],
-                    },
-                }
-            ]
-        }
+        assert response == CHART_IMPORT_INVALID_RESPONSE
 
     def test_gets_created_by_user_charts_filter(self):
-        arguments = {
-            "filters": [{"col": "id", "opr": "chart_has_created_by", "value": True}],
-            "keys": ["none"],
-            "columns": ["slice_name"],
-        }
+        admin = self.get_user("admin")
+        self._bulk_insert_charts(
+            [f"created_by_admin{cx}" for cx in range(2)],
+            [admin.id],
+            1,
+            created_by=admin,
+        )
         self.login(username="admin")
 
-        uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
+        uri = f"api/v1/chart/?q={CHART_HAS_CREATED_BY_QUERY}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data["count"], 8)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert data["count"] == 2
 
+    @pytest.mark.usefixtures("create_charts")
     def test_gets_not_created_by_user_charts_filter(self):
-        arguments = {
-            "filters": [{"col": "id", "opr": "chart_has_created_by", "value": False}],
-            "keys": ["none"],
-            "columns": ["slice_name"],
-        }
+        expected_count = (
+            db.session.query(Slice).filter(Slice.created_by_fk.is_(None)).count()
+        )
         self.login(username="admin")
 
-        uri = f"api/v1/chart/?q={prison.dumps(arguments)}"
+        uri = f"api/v1/chart/?q={CHART_HAS_NO_CREATED_BY_QUERY}"
         rv = self.get_assert_metric(uri, "get_list")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data["count"], 8)
+        assert rv.status_code == 200
+        data = _json(rv)
+        assert data["count"] == expected_count
 
     @pytest.mark.usefixtures("create_charts")
     def test_gets_owned_created_favorited_by_me_filter(self):
@@ -1756,91 +1841,69 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         Chart API: Test ChartOwnedCreatedFavoredByMeFilter
         """
         self.login(username="admin")
-        arguments = {
-            "filters": [
-                {
-                    "col": "id",
-                    "opr": "chart_owned_created_favored_by_me",
-                    "value": True,
-                }
-            ],
-            "order_column": "slice_name",
-            "order_direction": "asc",
-            "page": 0,
-            "page_size": 25,
-        }
-        rv = self.client.get(f"api/v1/chart/?q={prison.dumps(arguments)}")
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-
-        assert data["result"][0]["slice_name"] == "name0"
-        assert data["result"][0]["datasource_id"] == 1
-
-    @parameterized.expand(
-        [
-            "Top 10 Girl Name Share",  # Legacy chart
-            "Pivot Table v2",  # Non-legacy chart
-        ],
-    )
-    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
-    def test_warm_up_cache(self, slice_name):
-        self.login()
-        slc = self.get_slice(slice_name, db.session)
-        rv = self.client.put("/api/v1/chart/warm_up_cache", json={"chart_id": slc.id})
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-
-        self.assertEqual(
-            data["result"],
-            [{"chart_id": slc.id, "viz_error": None, "viz_status": "success"}],
+        rv = self.client.get(
+            f"api/v1/chart/?q={CHART_OWNED_CREATED_FAVORED_BY_ME_QUERY}"
         )
+        assert rv.status_code == 200
+        data = _json(rv)
 
-        dashboard = self.get_dash_by_slug("births")
+        # other fixtures in the class also create admin-owned charts, so
+        # assert membership rather than position
+        results_by_name = {result["slice_name"]: result for result in data["result"]}
+        assert "name0" in results_by_name
+        assert results_by_name["name0"]["datasource_id"] == 1
 
-        rv = self.client.put(
-            "/api/v1/chart/warm_up_cache",
-            json={"chart_id": slc.id, "dashboard_id": dashboard.id},
-        )
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(
-            data["result"],
-            [{"chart_id": slc.id, "viz_error": None, "viz_status": "success"}],
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices_class_scope")
+    def test_warm_up_cache(self):
+        self.login()
+        # the endpoint only takes a single chart per request, so the three
+        # payload shapes cannot be batched; share the dashboard lookup
+        # across the sub-tests instead
+        dashboard_id = self.get_dash_by_slug("births").id
+        slices = _slices_by_name(
+            (
+                "Top 10 Girl Name Share",  # Legacy chart
+                "Pivot Table v2",  # Non-legacy chart
+            )
         )
+        for slice_name, slc in slices.items():
+            with self.subTest(slice_name=slice_name):
+                self._assert_warm_up_cache(slc, dashboard_id)
 
-        rv = self.client.put(
-            "/api/v1/chart/warm_up_cache",
-            json={
+    def _assert_warm_up_cache(self, slc, dashboard_id):
+        expected_result = [
+            {"chart_id": slc.id, "viz_error": None, "viz_status": "success"}
+        ]
+        payloads = [
+            {"chart_id": slc.id},
+            {"chart_id": slc.id, "dashboard_id": dashboard_id},
+            {
                 "chart_id": slc.id,
-                "dashboard_id": dashboard.id,
+                "dashboard_id": dashboard_id,
                 "extra_filters": json.dumps(
                     [{"col": "name", "op": "in", "val": ["Jennifer"]}]
                 ),
             },
-        )
-        self.assertEqual(rv.status_code, 200)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(
-            data["result"],
-            [{"chart_id": slc.id, "viz_error": None, "viz_status": "success"}],
-        )
+        ]
+        for payload in payloads:
+            rv = self.client.put("/api/v1/chart/warm_up_cache", json=payload)
+            assert rv.status_code == 200
+            data = _json(rv)
+            assert data["result"] == expected_result
 
     def test_warm_up_cache_chart_id_required(self):
         self.login()
         rv = self.client.put("/api/v1/chart/warm_up_cache", json={"dashboard_id": 1})
-        self.assertEqual(rv.status_code, 400)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(
-            data,
-            {"message": {"chart_id": ["Missing data for required field."]}},
-        )
+        assert rv.status_code == 400
+        data = _json(rv)
+        assert data == {"message": {"chart_id": ["Missing data for required field."]}}
 
     def test_warm_up_cache_chart_not_found(self):
         self.login()
         rv = self.client.put("/api/v1/chart/warm_up_cache", json={"chart_id": 99999})
-        self.assertEqual(rv.status_code, 404)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(data, {"message": "Chart not found"})
+        assert rv.status_code == 404
+        data = _json(rv)
+        assert data == {"message": "Chart not found"}
 
     def test_warm_up_cache_payload_validation(self):
         self.login()
@@ -1848,93 +1911,64 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
             "/api/v1/chart/warm_up_cache",
             json={"chart_id": "id", "dashboard_id": "id", "extra_filters": 4},
         )
-        self.assertEqual(rv.status_code, 400)
-        data = json.loads(rv.data.decode("utf-8"))
-        self.assertEqual(
-            data,
-            {
-                "message": {
-                    "chart_id": ["Not a valid integer."],
-                    "dashboard_id": ["Not a valid integer."],
-                    "extra_filters": ["Not a valid string."],
-                }
-            },
-        )
-
-    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
-    def test_warm_up_cache_error(self) -> None:
-        self.login()
-        slc = self.get_slice("Pivot Table v2", db.session)
-
-        with mock.patch.object(ChartDataCommand, "run") as mock_run:
-            mock_run.side_effect = ChartDataQueryFailedError(
-                _(
-                    "Error: %(error)s",
-                    error=_("Empty query?"),
-                )
-            )
-
-            assert json.loads(
-                self.client.put(
-                    "/api/v1/chart/warm_up_cache",
-                    json={"chart_id": slc.id},
-                ).data
-            ) == {
-                "result": [
-                    {
-                        "chart_id": slc.id,
-                        "viz_error": "Error: Empty query?",
-                        "viz_status": None,
-                    },
-                ],
-            }
-
-    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
-    def test_warm_up_cache_no_query_context(self) -> None:
-        self.login()
-        slc = self.get_slice("Pivot Table v2", db.session)
-
-        with mock.patch.object(Slice, "get_query_context") as mock_get_query_context:
-            mock_get_query_context.return_value = None
-
-            assert json.loads(
-                self.client.put(
-                    f"/api/v1/chart/warm_up_cache",
-                    json={"chart_id": slc.id},
-                ).data
-            ) == {
-                "result": [
-                    {
-                        "chart_id": slc.id,
-                        "viz_error": "Chart's query context does not exist",
-                        "viz_status": None,
-                    },
-                ],
+        assert rv.status_code == 400
+        data = _json(rv)
+        assert data == {
+            "message": {
+                "chart_id": ["Not a valid integer."],
+                "dashboard_id": ["Not a valid integer."],
+                "extra_filters": ["Not a valid string."],
             }
+        }
 
-    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
-    def test_warm_up_cache_no_datasource(self) -> None:
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices_class_scope")
+    def test_warm_up_cache_error(self) -> None:
+        # the three failure modes share login and slice lookups; run them as
+        # sub-tests instead of three separate tests
         self.login()
-        slc = self.get_slice("Top 10 Girl Name Share", db.session)
-
-        with mock.patch.object(
-            Slice,
-            "datasource",
-            new_callable=mock.PropertyMock,
-        ) as mock_datasource:
-            mock_datasource.return_value = None
-
-            assert json.loads(
-                self.client.put(
-                    f"/api/v1/chart/warm_up_cache",
-                    json={"chart_id": slc.id},
-                ).data
-            ) == {
-                "result": [
-                    {
-                        "chart_id": slc.id,
-                        "viz_error": "Chart's datasource does not exist",
-                        "viz_status": None,
-                    },
-                ],
-            }
+        slices_by_name = _slices_by_name(("Pivot Table v2", "Top 10 Girl Name Share"))
+        cases = [
+            (
+                "Pivot Table v2",
+                mock.patch.object(
+                    ChartDataCommand,
+                    "run",
+                    side_effect=ChartDataQueryFailedError(
+                        _("Error: %(error)s", error=_("Empty query?"))
+                    ),
+                ),
+                "Error: Empty query?",
+            ),
+            (
+                "Pivot Table v2",
+                mock.patch.object(Slice, "get_query_context", return_value=None),
+                "Chart's query context does not exist",
+            ),
+            (
+                "Top 10 Girl Name Share",
+                mock.patch.object(
+                    Slice,
+                    "datasource",
+                    new_callable=mock.PropertyMock,
+                    return_value=None,
+                ),
+                "Chart's datasource does not exist",
+            ),
+        ]
+        for slice_name, patcher, viz_error in cases:
+            with self.subTest(viz_error=viz_error):
+                slc = slices_by_name[slice_name]
+                with patcher:
+                    rv = self.client.put(
+                        "/api/v1/chart/warm_up_cache",
+                        json={"chart_id": slc.id},
+                    )
+                assert _json(rv) == {
+                    "result": [
+                        {
+                            "chart_id": slc.id,
+                            "viz_error": viz_error,
+                            "viz_status": None,
+                        },
+                    ],
+                }
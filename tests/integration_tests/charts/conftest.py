@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pytest
+
+from superset import db, security_manager
+from superset.utils.database import get_example_database
+from tests.integration_tests.base_tests import SupersetTestCase
+from tests.integration_tests.dashboard_utils import create_table_metadata
+from tests.integration_tests.test_app import (
+    app,
+    register_stable_test_user,
+    unregister_stable_test_user,
+)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def setup_chart_datasource():
+    """
+    The chart fixtures in this package reference the first example datasource
+    (``datasource_id=1``). Create its metadata once per session, outside the
+    per-test transaction, so it is visible to every test.
+    """
+    with app.app_context():
+        # create_table_metadata is get-or-create; the row is left in place on
+        # teardown (like the dashboard fixtures leave theirs) because the
+        # tests pin ``datasource_id=1`` and deleting it would hand the id to
+        # another table on the next run against the same database
+        create_table_metadata("birth_names", get_example_database())
+
+
+@pytest.fixture(scope="package")
+def alpha_users():
+    """
+    The "not owned" tests all need the same pair of Alpha users; create them
+    once instead of inserting and deleting them in every test. Package scope
+    tears them down when the charts tests finish: other packages (dashboards,
+    reports) create users with the same names and assume they don't exist.
+    """
+    usernames = ("alpha1", "alpha2")
+    with app.app_context():
+        user_ids = [
+            SupersetTestCase.create_user(
+                username, "password", "Alpha", email=f"{username}@superset.org"
+            ).id
+            for username in usernames
+        ]
+    # the users live for the rest of the session, so their login cookies
+    # can be cached like those of the seeded test users
+    for username in usernames:
+        register_stable_test_user(username)
+
+    yield
+
+    for username in usernames:
+        unregister_stable_test_user(username)
+        SupersetTestCase._user_id_cache.pop(username, None)
+    with app.app_context():
+        for user in db.session.query(security_manager.user_model).filter(
+            security_manager.user_model.id.in_(user_ids)
+        ):
+            db.session.delete(user)
+        db.session.commit()
@@ -61,9 +61,13 @@ def load_birth_names_dashboard_with_slices_module_scope(load_birth_names_data):
 
 @pytest.fixture(scope="class")
 def load_birth_names_dashboard_with_slices_class_scope(load_birth_names_data):
+    # use separate app contexts for setup and teardown: class-scoped fixtures
+    # are not finalized in reverse setup order, so a context held across the
+    # yield can be popped out of order when several of them are active
     with app.app_context():
         dash_id_to_delete, slices_ids_to_delete = _create_dashboards()
-        yield
+    yield
+    with app.app_context():
         _cleanup(dash_id_to_delete, slices_ids_to_delete)
 
 
@@ -86,9 +86,13 @@ def load_world_bank_dashboard_with_slices_module_scope(load_world_bank_data):
 
 @pytest.fixture(scope="class")
 def load_world_bank_dashboard_with_slices_class_scope(load_world_bank_data):
+    # use separate app contexts for setup and teardown: class-scoped fixtures
+    # are not finalized in reverse setup order, so a context held across the
+    # yield can be popped out of order when several of them are active
     with app.app_context():
         dash_id_to_delete, slices_ids_to_delete = create_dashboard_for_loaded_data()
-        yield
+    yield
+    with app.app_context():
         _cleanup(dash_id_to_delete, slices_ids_to_delete)
 
 
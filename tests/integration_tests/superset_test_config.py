@@ -17,10 +17,12 @@
 # type: ignore
 import logging
 import math
+import shutil
 from copy import copy
 from datetime import timedelta
 
 from superset.config import *
+from superset.stats_logger import BaseStatsLogger
 from tests.integration_tests.superset_test_custom_template_processors import (
     CustomPrestoTemplateProcessor,
 )
@@ -42,6 +44,22 @@ SILENCE_FAB = False
 if "SUPERSET__SQLALCHEMY_DATABASE_URI" in os.environ:
     SQLALCHEMY_DATABASE_URI = os.environ["SUPERSET__SQLALCHEMY_DATABASE_URI"]
 
+# When running under pytest-xdist, point every worker at its own copy of the
+# metadata database so tests can run in parallel without sharing state.
+# SQLite workers are seeded by copying the already-migrated base file; other
+# backends are expected to have the per-worker database created from a
+# template ahead of time (e.g. CREATE DATABASE ... TEMPLATE on PostgreSQL).
+PYTEST_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if PYTEST_XDIST_WORKER:
+    if SQLALCHEMY_DATABASE_URI.startswith("sqlite:///"):
+        base_db_path = SQLALCHEMY_DATABASE_URI[len("sqlite:///") :]
+        worker_db_path = f"{base_db_path}.{PYTEST_XDIST_WORKER}"
+        if os.path.exists(base_db_path) and not os.path.exists(worker_db_path):
+            shutil.copyfile(base_db_path, worker_db_path)
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{worker_db_path}"
+    else:
+        SQLALCHEMY_DATABASE_URI = f"{SQLALCHEMY_DATABASE_URI}_{PYTEST_XDIST_WORKER}"
+
 SQLALCHEMY_EXAMPLES_URI = SQLALCHEMY_DATABASE_URI
 if "SUPERSET__SQLALCHEMY_EXAMPLES_URI" in os.environ:
     SQLALCHEMY_EXAMPLES_URI = os.environ["SUPERSET__SQLALCHEMY_EXAMPLES_URI"]
@@ -59,6 +77,29 @@ if "sqlite" in SQLALCHEMY_DATABASE_URI:
 PRESTO_POLL_INTERVAL = 0.1
 HIVE_POLL_INTERVAL = 0.1
 
+
+class NullStatsLogger(BaseStatsLogger):
+    """
+    A fully silent stats logger; the default DummyStatsLogger still formats a
+    colorized debug message for every emit, which adds up across the
+    thousands of metrics the API tests trigger.
+    """
+
+    def incr(self, key):
+        pass
+
+    def decr(self, key):
+        pass
+
+    def timing(self, key, value):
+        pass
+
+    def gauge(self, key, value):
+        pass
+
+
+STATS_LOGGER = NullStatsLogger()
+
 SQL_MAX_ROW = 50000
 SQLLAB_CTAS_NO_LIMIT = True  # SQL_MAX_ROW will not take effect for the CTA queries
 FEATURE_FLAGS = {
@@ -30,12 +30,50 @@ superset_config_module = environ.get(
 )
 app = create_app(superset_config_module=superset_config_module)
 
+# usernames seeded once per session by ``load_test_users_run``; their ids
+# never change, so their session cookies can be reused across test clients
+STABLE_TEST_USERNAMES: set[str] = {
+    "admin",
+    "gamma",
+    "gamma2",
+    "gamma_sqllab",
+    "alpha",
+    "gamma_no_csv",
+}
+_login_cookie_cache: dict[tuple[str, str], str] = {}
+
+
+def register_stable_test_user(username: str):
+    """
+    Opt a test-created user into the login cookie cache. Only do this for
+    users whose id does not change for the rest of the session (e.g. users
+    created by a session-scoped fixture).
+    """
+    STABLE_TEST_USERNAMES.add(username)
+
+
+def unregister_stable_test_user(username: str):
+    """Remove a user from the cookie cache, evicting any cached cookies."""
+    STABLE_TEST_USERNAMES.discard(username)
+    for key in [key for key in _login_cookie_cache if key[0] == username]:
+        del _login_cookie_cache[key]
+
 
 def login(
     client: "FlaskClient[Any]", username: str = "admin", password: str = "general"
 ):
+    # the POST to /login/ runs a bcrypt password check on every call; reuse
+    # the signed session cookie from a previous successful login instead
+    cached_cookie = _login_cookie_cache.get((username, password))
+    if cached_cookie is not None:
+        client.set_cookie("session", cached_cookie)
+        return
     resp = client.post(
         "/login/",
         data=dict(username=username, password=password),
     ).get_data(as_text=True)
     assert "User confirmation needed" not in resp
+    if username in STABLE_TEST_USERNAMES:
+        session_cookie = client.get_cookie("session")
+        if session_cookie is not None:
+            _login_cookie_cache[(username, password)] = session_cookie.value
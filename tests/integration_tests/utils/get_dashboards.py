@@ -21,6 +21,13 @@ from superset.models.dashboard import Dashboard
 
 
 def get_dashboards_ids(db: SQLA, dashboard_slugs: list[str]) -> list[int]:
+    """
+    Resolve dashboard slugs to ids with a single scalar query.
+
+    Deliberately not memoized: the ``load_*_dashboard_with_slices`` fixtures
+    are function scoped, so the dashboards behind these slugs are recreated
+    with fresh ids for every test that uses them.
+    """
     result = (
         db.session.query(Dashboard.id).filter(Dashboard.slug.in_(dashboard_slugs)).all()
     )